@@ -4,23 +4,42 @@ HTML Collection Script
 Fetches and saves HTML content from job URLs for HTML parsing
 """
 
-import json
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 import os
 import hashlib
+import queue
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 from urllib.parse import urlparse
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml.etree import ParserError
+from src.job_curator.scraper.rate_limiter import HostRateLimiter
 
 
 class HTMLCollector:
-    def __init__(self):
+    def __init__(self, requests_per_host_per_second: float = 1.0):
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
+        # Larger keep-alive pool for concurrent requests, with backoff on transient errors
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.cache_dir = "html_cache"
-        self.rate_limit_delay = 1
+        self.max_workers = 8  # Concurrent fetches
+        self.rate_limiter = HostRateLimiter(max_calls=1, period=1.0 / requests_per_host_per_second)
+        self._write_q = None  # Set while collect_all_urls runs its writer thread
         
         # Ensure cache directory exists
         os.makedirs(self.cache_dir, exist_ok=True)
@@ -38,47 +57,71 @@ class HTMLCollector:
             filename = f"{company}_jobs_{job_id}.html"
         else:
             # Fallback: use URL hash
-            url_hash = hashlib.md5(url.encode()).hexdigest()[:12]
+            url_hash = hashlib.blake2b(url.encode(), digest_size=6).hexdigest()
             filename = f"job_{url_hash}.html"
         
         return filename
     
-    def fetch_and_save_html(self, url: str) -> bool:
-        """Fetch HTML content and save to cache"""
-        filename = self.url_to_filename(url)
+    def _write_metadata(self, filepath: str, metadata: dict):
+        """Write the metadata file that sits next to a cached HTML file"""
+        metadata_file = filepath.replace('.html', '_metadata.json')
+        with open(metadata_file, 'wb') as f:
+            f.write(orjson.dumps(metadata))
+    
+    def _writer_loop(self, write_q: queue.Queue):
+        """Drain queued metadata writes until the None sentinel arrives"""
+        while True:
+            item = write_q.get()
+            if item is None:
+                break
+            filepath, metadata = item
+            try:
+                self._write_metadata(filepath, metadata)
+            except OSError as e:
+                print(f"❌ Failed to write metadata for {filepath}: {e}")
+    
+    def fetch_and_save_html(self, url: str, filename: Optional[str] = None) -> bool:
+        """Fetch HTML content and save to cache, under filename when the caller already has it"""
+        filename = filename or self.url_to_filename(url)
         filepath = os.path.join(self.cache_dir, filename)
         
-        # Skip if already cached
-        if os.path.exists(filepath):
-            print(f"✅ Already cached: {filename}")
-            return True
+        partial_path = filepath + '.part'
         
         try:
             print(f"🌐 Fetching: {url}")
-            response = self.session.get(url, timeout=15)
-            response.raise_for_status()
+            # Stream the raw body straight to disk instead of buffering and decoding it
+            self.rate_limiter.wait(url)
+            with self.session.get(url, timeout=15, stream=True) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True  # Undo gzip/deflate transfer encoding
+                with open(partial_path, 'wb') as f:
+                    shutil.copyfileobj(response.raw, f, length=64 * 1024)
+                status_code = response.status_code
             
-            # Save raw HTML
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(response.text)
+            # Only complete downloads become visible as cached files
+            os.replace(partial_path, filepath)
+            content_length = os.path.getsize(filepath)
             
-            # Save metadata
             metadata = {
                 'url': url,
                 'filename': filename,
-                'status_code': response.status_code,
-                'content_length': len(response.text),
+                'status_code': status_code,
+                'content_length': content_length,
                 'fetch_time': time.time()
             }
             
-            metadata_file = filepath.replace('.html', '_metadata.json')
-            with open(metadata_file, 'w') as f:
-                json.dump(metadata, f, indent=2)
+            # Hand the metadata write to the writer thread when one is running
+            if self._write_q is not None:
+                self._write_q.put((filepath, metadata))
+            else:
+                self._write_metadata(filepath, metadata)
             
-            print(f"✅ Saved: {filename} ({len(response.text)} chars)")
+            print(f"✅ Saved: {filename} ({content_length} bytes)")
             return True
             
         except Exception as e:
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
             print(f"❌ Failed to fetch {url}: {e}")
             return False
     
@@ -86,8 +129,8 @@ class HTMLCollector:
         """Collect HTML for all URLs in the list"""
         # Load URLs
         try:
-            with open(urls_file, 'r') as f:
-                urls = json.load(f)
+            with open(urls_file, 'rb') as f:
+                urls = orjson.loads(f.read())
         except Exception as e:
             print(f"Error loading URLs: {e}")
             return {}
@@ -101,12 +144,45 @@ class HTMLCollector:
             'cached_files': []
         }
         
-        for i, url in enumerate(urls, 1):
-            print(f"\n--- {i}/{len(urls)} ---")
-            
-            if self.fetch_and_save_html(url):
+        # Split into already-cached and to-fetch with a single directory scan,
+        # fetching URLs that map to the same file only once
+        existing = set(os.listdir(self.cache_dir))
+        filenames = [self.url_to_filename(url) for url in urls]
+        seen = set()
+        cached = []
+        to_fetch = []
+        fetch_files = []
+        for url, filename in zip(urls, filenames):
+            if filename in seen:
+                continue
+            seen.add(filename)
+            if filename in existing:
+                cached.append(filename)
+            else:
+                to_fetch.append(url)
+                fetch_files.append(filename)
+        
+        print(f"✅ Already cached: {len(cached)}, fetching: {len(to_fetch)}")
+        
+        # Fetch concurrently; the pool size bounds in-flight requests while a
+        # single writer thread takes metadata writes off the fetch path
+        self._write_q = queue.Queue(maxsize=256)
+        writer = threading.Thread(target=self._writer_loop, args=(self._write_q,), daemon=True)
+        writer.start()
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                fetched = list(executor.map(self.fetch_and_save_html, to_fetch, fetch_files))
+        finally:
+            self._write_q.put(None)
+            writer.join()
+            self._write_q = None
+        
+        # A duplicate URL counts with the outcome of the first URL for its file
+        outcomes = dict.fromkeys(cached, True)
+        outcomes.update(zip(fetch_files, fetched))
+        for url, filename in zip(urls, filenames):
+            if outcomes[filename]:
                 results['successful'] += 1
-                filename = self.url_to_filename(url)
                 results['cached_files'].append({
                     'url': url,
                     'filename': filename,
@@ -114,13 +190,10 @@ class HTMLCollector:
                 })
             else:
                 results['failed'] += 1
-            
-            # Rate limiting
-            time.sleep(self.rate_limit_delay)
         
         # Save collection summary
-        with open('html_collection_summary.json', 'w') as f:
-            json.dump(results, f, indent=2)
+        with open('html_collection_summary.json', 'wb') as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
         
         print(f"\n🎉 Collection Complete!")
         print(f"✅ Successful: {results['successful']}")
@@ -131,26 +204,36 @@ class HTMLCollector:
     
     def preview_cached_content(self, limit: int = 3):
         """Preview some cached HTML files"""
-        html_files = [f for f in os.listdir(self.cache_dir) if f.endswith('.html')]
+        # Stop scanning once enough files for the preview have been found
+        html_files = []
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith('.html') and entry.is_file():
+                    html_files.append(entry.name)
+                    if len(html_files) >= limit:
+                        break
         
-        print(f"📂 Found {len(html_files)} cached HTML files")
+        print(f"📂 Previewing {len(html_files)} cached HTML files")
         
-        for filename in html_files[:limit]:
+        for filename in html_files:
             filepath = os.path.join(self.cache_dir, filename)
             
             print(f"\n--- Preview: {filename} ---")
             
-            with open(filepath, 'r', encoding='utf-8') as f:
+            with open(filepath, 'rb') as f:
                 content = f.read()
             
-            # Parse with BeautifulSoup for preview
-            soup = BeautifulSoup(content, 'html.parser')
-            title = soup.find('title')
-            h1 = soup.find('h1')
+            # Parse with lxml for preview, reading the cached bytes as UTF-8
+            try:
+                tree = lxml.html.fromstring(content, parser=lxml.html.HTMLParser(encoding='utf-8'))
+            except ParserError:  # Empty or comment-only file
+                tree = None
+            title = tree.find('.//title') if tree is not None else None
+            h1 = tree.find('.//h1') if tree is not None else None
             
-            print(f"📄 Title: {title.text.strip() if title else 'No title'}")
-            print(f"📰 H1: {h1.text.strip() if h1 else 'No H1'}")
-            print(f"📊 Content length: {len(content)} characters")
+            print(f"📄 Title: {title.text_content().strip() if title is not None else 'No title'}")
+            print(f"📰 H1: {h1.text_content().strip() if h1 is not None else 'No H1'}")
+            print(f"📊 Content length: {len(content)} bytes")
 
 
 def main():
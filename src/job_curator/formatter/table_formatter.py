@@ -10,36 +10,30 @@ class TableFormatter:
             return
         
         headers = ["Job Title", "Company", "Location", "Technical Skills", "Compensation", "URL"]
-        rows = []
-        
-        for job in jobs:
-            compensation = job.compensation if job.compensation else "Not specified"
-            url = job.url[:50] + "..." if len(job.url) > 50 else job.url
-            technical_skills = job.technical_skills[:40] + "..." if len(job.technical_skills) > 40 else job.technical_skills
-            
-            rows.append([
+        # Slicing past the cutoff is empty for short strings, so no len() is needed
+        rows = [
+            [
                 job.title,
                 job.company,
                 job.location,
-                technical_skills,
-                compensation,
-                url
-            ])
+                (job.technical_skills[:40] + "...") if job.technical_skills[40:] else job.technical_skills,
+                job.compensation or "Not specified",
+                (job.url[:50] + "...") if job.url[50:] else job.url
+            ]
+            for job in jobs
+        ]
         
         print(f"\nFound {len(jobs)} job(s):")
-        print(tabulate(rows, headers=headers, tablefmt="grid", maxcolwidths=[30, 20, 25, 20, 50]))
+        print(tabulate(rows, headers=headers, tablefmt="grid", maxcolwidths=[30, 20, 25, 20, 50], disable_numparse=True))
     
     def export_csv(self, jobs: List[JobPosting], filename: str):
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+        rows = [
+            [job.title, job.company, job.location, job.technical_skills, job.compensation or "Not specified", job.url]
+            for job in jobs
+        ]
+        
+        # Build all rows first, then hand them to the writer in one call
+        with open(filename, 'w', newline='', encoding='utf-8', buffering=1024 * 1024) as csvfile:
             writer = csv.writer(csvfile)
             writer.writerow(["Job Title", "Company", "Location", "Technical Skills", "Compensation", "URL"])
-            
-            for job in jobs:
-                writer.writerow([
-                    job.title,
-                    job.company,
-                    job.location,
-                    job.technical_skills,
-                    job.compensation or "Not specified",
-                    job.url
-                ])
\ No newline at end of file
+            writer.writerows(rows)
\ No newline at end of file
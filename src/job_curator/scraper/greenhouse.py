@@ -1,15 +1,82 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
-import time
-from dataclasses import dataclass
-from typing import List, Optional
+import lxml.html
+from lxml.etree import ParserError
+import threading
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, replace
+from functools import lru_cache
+from itertools import islice
+from typing import List, Optional, Union
 import re
-import json
+import html
+import hashlib
+import orjson
 import os
 from datetime import datetime, timedelta
+from urllib.parse import urlsplit
 from .google_search import GoogleSearchService
+from .rate_limiter import HostRateLimiter
 
-@dataclass
+# Version stamped into the parse cache file; bump it whenever extraction results change,
+# so cached results from the old code are discarded
+_PARSE_CACHE_VERSION = 1
+
+# Salary range or labelled salary/compensation amount, matched in a single scan
+_COMP_RE = re.compile(r'\$[\d,]+k?\s*-\s*\$[\d,]+k?|(?:salary|compensation):?\s*\$[\d,]+', re.IGNORECASE)
+
+# Patterns used while extracting jobs from HTML, compiled once at import
+_BOARDS_URL_RE = re.compile(r'boards\.greenhouse\.io/([^/]+)/')
+_BOARDS_COMPANY_RE = re.compile(r'boards\.greenhouse\.io/([^/]+)')
+_PAY_RANGE_RE = re.compile(r'\$[\d,]+\s*[—\-]\s*\$[\d,]+')
+_LOCATION_JSON_RE = re.compile(r'"location":"([^"]+)"')
+_LOC_PATTERNS = [
+    re.compile(r'([^,]+,\s*[A-Z]{2}(?:,\s*United States)?)'),  # City, State or City, State, United States
+    re.compile(r'(Remote\s*[-–—]?\s*[^,\n]*)'),  # Remote variations
+    re.compile(r'([A-Z][a-z]+,\s*[A-Z]{2})'),  # Simple City, State
+]
+_SALARY_COMBINED_RE = re.compile(r'\$[\d,]+\s*[-–—]\s*\$[\d,]+|\$[\d,]+k?\s*-\s*\$[\d,]+k?')
+_STATE_ABBR_RE = re.compile(r',\s*[A-Z]{2}(\s|$)')
+_JOBS_NUM_RE = re.compile(r'/jobs/\d+')
+_LD_JSON_RE = re.compile(r'<script[^>]*application/ld\+json[^>]*>(.*?)</script>', re.DOTALL | re.IGNORECASE)
+_LD_JSON_BYTES_RE = re.compile(_LD_JSON_RE.pattern.encode(), re.DOTALL | re.IGNORECASE)
+
+# Job-related or non-location keywords that disqualify location candidates
+NON_LOCATION_KEYWORDS = [
+    'scientist', 'engineer', 'manager', 'director', 'senior', 'staff', 'principal', 'data', 'analyst', 'developer',
+    'careers', 'jobs', 'opportunities', 'openings', 'positions', 'apply', 'team', 'department',
+    'benefits', 'salary', 'compensation', 'experience', 'requirements', 'qualifications'
+]
+
+LOCATION_INDICATORS = [
+    'remote', 'hybrid', 'office',
+    'india', 'usa', 'united states', 'america',
+    'california', 'texas', 'new york', 'florida', 'washington', 'massachusetts',
+    'san francisco', 'boston', 'seattle', 'austin', 'chicago', 'los angeles',
+    'london', 'toronto', 'sydney', 'berlin', 'amsterdam',
+    'ca', 'ny', 'tx', 'fl', 'wa', 'ma'
+]
+
+# Words that mark a location candidate as really being part of a job title
+JOB_TITLE_WORDS = ['scientist', 'engineer', 'manager', 'director', 'senior', 'staff', 'principal', 'data']
+
+# Each keyword list as one alternation, so a candidate is scanned once per list
+_NON_LOC_RE = re.compile('|'.join(map(re.escape, NON_LOCATION_KEYWORDS)), re.IGNORECASE)
+_LOC_IND_RE = re.compile('|'.join(map(re.escape, LOCATION_INDICATORS)), re.IGNORECASE)
+# Whole words only, and matched against lowercased text
+_JOB_TITLE_WORDS_RE = re.compile(r'\b(?:' + '|'.join(map(re.escape, JOB_TITLE_WORDS)) + r')\b')
+
+# Place names used to score location candidates by specificity
+_CITIES = frozenset(['san francisco', 'new york', 'boston', 'seattle', 'austin', 'chicago', 'los angeles', 'denver', 'atlanta', 'miami'])
+_STATES = frozenset(['california', 'texas', 'new york', 'florida', 'washington', 'massachusetts'])
+_COUNTRIES = frozenset(['united states', 'usa', 'america'])
+_CITY_RE = re.compile('|'.join(map(re.escape, sorted(_CITIES))))
+_STATE_RE = re.compile('|'.join(map(re.escape, sorted(_STATES))))
+
+@dataclass(slots=True, frozen=True)
 class JobPosting:
     title: str
     company: str
@@ -19,18 +86,380 @@ class JobPosting:
     compensation: Optional[str] = None
     posted_date: Optional[str] = None
 
+def _html_tree(content):
+    """Parse an HTML document or fragment, reading bytes as UTF-8 rather than lxml's Latin-1 default"""
+    if isinstance(content, bytes):
+        return lxml.html.fromstring(content, parser=lxml.html.HTMLParser(encoding='utf-8'))
+    return lxml.html.fromstring(content)
+
+def _element_text(element) -> str:
+    """Return the stripped text of an lxml element, skipping script/style"""
+    return "".join(text.strip() for text in element.xpath('.//text()[not(parent::script or parent::style)]'))
+
+def _inline_text(element) -> str:
+    """Return an lxml element's text as it reads, skipping script/style, with only the ends stripped"""
+    return "".join(element.xpath('.//text()[not(parent::script or parent::style)]')).strip()
+
+def _html_text(content) -> str:
+    """Return the stripped text of an HTML document or fragment"""
+    try:
+        tree = _html_tree(content)
+    except ParserError:  # Empty or comment-only markup
+        return ""
+    return _element_text(tree)
+
+def _page_text(content) -> str:
+    """Return the visible text of an HTML document or fragment, joined as it appears"""
+    try:
+        tree = _html_tree(content)
+    except ParserError:  # Empty or comment-only markup
+        return ""
+    return "".join(tree.xpath('//text()[not(parent::script or parent::style)]'))
+
+def _in_html_comment(content: Union[str, bytes], pos: int) -> bool:
+    """Check whether a position in raw markup falls inside an <!-- --> comment"""
+    start, end = ('<!--', '-->') if isinstance(content, str) else (b'<!--', b'-->')
+    return content.rfind(start, 0, pos) > content.rfind(end, 0, pos)
+
+def _parse_json_ld_job(data: dict, job_title: str = "", company: str = "", location: str = ""):
+    """Read title, company, location and compensation from a JSON-LD JobPosting"""
+    job_title = data.get('title', job_title).strip()
+    if data.get('hiringOrganization'):
+        company = data['hiringOrganization'].get('name', company)
+    if data.get('jobLocation'):
+        job_location = data['jobLocation']
+        if isinstance(job_location, dict):
+            location = job_location.get('address', location)
+        elif isinstance(job_location, str):
+            location = job_location
+    
+    # Extract compensation from structured data
+    compensation = None
+    description = data.get('description', '')
+    if 'pay range' in description.lower():
+        salary_match = _PAY_RANGE_RE.search(description)
+        if salary_match:
+            compensation = salary_match.group()
+    
+    return job_title, company, location, compensation
+
+def _search_salary(text: str) -> Optional[str]:
+    """Find a salary range anywhere in page text"""
+    match = _SALARY_COMBINED_RE.search(text)
+    return match.group() if match else None
+
+@lru_cache(maxsize=4096)
+def _is_location_text(text: str) -> bool:
+    """Check if text looks like a location (memoized, since strategies revisit the same candidates)"""
+    if not text or len(text) > 100 or len(text) < 2:
+        return False
+    
+    # Skip if it contains job-related or non-location keywords
+    if _NON_LOC_RE.search(text):
+        return False
+    
+    # Check for location indicators
+    return _LOC_IND_RE.search(text) is not None
+
+def _choose_best_location(locations: list) -> str:
+    """Choose the most specific/useful location from a list of candidates"""
+    if not locations:
+        return ""
+    
+    # Remove duplicates while preserving order
+    unique_locations = list(dict.fromkeys(locations))
+    
+    # Scoring system for location specificity
+    def location_score(loc):
+        score = 0
+        loc_lower = loc.lower()
+        
+        # City names (highest priority)
+        score += 100 * len(set(_CITY_RE.findall(loc_lower)))
+        
+        has_state = _STATE_RE.search(loc_lower) is not None
+        
+        # Contains city, state pattern
+        if ',' in loc and has_state:
+            score += 80
+        
+        # State abbreviations with comma (e.g., "San Francisco, CA")
+        if _STATE_ABBR_RE.search(loc):
+            score += 70
+        
+        # Remote indicators
+        if 'remote' in loc_lower:
+            score += 60
+        
+        # Specific countries/regions
+        if 'india' in loc_lower:
+            score += 50
+        
+        # State names
+        if has_state:
+            score += 40
+        
+        # Generic country names (lower priority)
+        if loc_lower in _COUNTRIES:
+            score += 10
+        
+        # Penalty for very short locations (likely abbreviations taken out of context)
+        if len(loc) <= 3:
+            score -= 20
+        
+        return score
+    
+    # Sort by score (highest first)
+    scored_locations = [(loc, location_score(loc)) for loc in unique_locations]
+    scored_locations.sort(key=lambda x: x[1], reverse=True)
+    
+    # Return the highest scoring location
+    best_location = scored_locations[0][0]
+    return best_location
+
+def _build_job(job_title: str, company: str, location: str, compensation: Optional[str], filename: str) -> Optional[JobPosting]:
+    """Validate extracted fields and build the job posting"""
+    # Validate and clean location before returning
+    if location and job_title:
+        loc_lower = location.lower()
+        title_lower = job_title.lower()
+        # Don't use location if it's the same as job title or contains job title
+        if (loc_lower == title_lower or 
+            title_lower in loc_lower or
+            _JOB_TITLE_WORDS_RE.search(loc_lower)):
+            location = ""
+    
+    # Only return if we have meaningful data
+    if job_title and company and len(job_title) > 3:
+        return JobPosting(
+            title=job_title,
+            company=company,
+            url=filename,  # Use filename as URL for cached HTML
+            location=location or "Location not specified",
+            technical_skills="",
+            compensation=compensation
+        )
+    
+    return None
+
+def _extract_job_from_json_ld(html_content: Union[str, bytes], filename: str) -> Optional[JobPosting]:
+    """Build a job straight from an embedded JSON-LD JobPosting
+    
+    The page itself is parsed only when the JobPosting carries no salary and the markup
+    contains a dollar sign, to look for a salary in the page text.
+    
+    Returns None when the JobPosting is missing or lacks the title, company or location,
+    so the caller falls back to full HTML parsing.
+    """
+    # Raw response bytes are scanned as-is, so the happy path never decodes the page
+    ld_json_re = _LD_JSON_BYTES_RE if isinstance(html_content, bytes) else _LD_JSON_RE
+    for match in ld_json_re.finditer(html_content):
+        # A commented-out script is not part of the page
+        if _in_html_comment(html_content, match.start()):
+            continue
+        try:
+            data = orjson.loads(match.group(1))
+        except ValueError:
+            continue
+        if not isinstance(data, dict) or data.get('@type') != 'JobPosting':
+            continue
+        
+        try:
+            job_title, company, location, compensation = _parse_json_ld_job(data)
+        except (AttributeError, TypeError):
+            return None
+        if not (job_title and company and location and isinstance(location, str)):
+            return None
+        
+        # Look for a salary in the job description's text first, then in the page text;
+        # never in raw markup, where tags and entities split ranges and scripts add false ones
+        if not compensation:
+            compensation = _search_salary(_page_text(html.unescape(data.get('description', ''))))
+        if not compensation and ('$' if isinstance(html_content, str) else b'$') in html_content:
+            compensation = _search_salary(_page_text(html_content))
+        
+        return _build_job(job_title, company, location, compensation, filename)
+    
+    return None
+
+def _parse_job_html(html_content: Union[str, bytes], filename: str, url: str = None) -> Optional[JobPosting]:
+    """Extract job information from HTML content (str, or raw bytes decoded by the parser)
+    
+    Module-level, like the helpers it uses, so process pools can pickle it.
+    """
+    # Most Greenhouse pages embed a JSON-LD JobPosting; only build a parse tree without one
+    job = _extract_job_from_json_ld(html_content, filename)
+    if job:
+        return job
+    
+    soup = BeautifulSoup(html_content, 'lxml')
+    
+    # Extract title
+    title_tag = soup.find('title')
+    page_title = title_tag.get_text().strip() if title_tag else ""
+    
+    # Parse title for job info
+    job_title = ""
+    company = ""
+    location = ""
+    
+    if " - " in page_title:
+        parts = page_title.split(" - ")
+        if len(parts) >= 3:
+            job_title = parts[0].strip()
+            location = " - ".join(parts[1:-1]).strip()
+            company = parts[-1].strip()
+        elif len(parts) >= 2:
+            job_title = parts[0].strip()
+            company = parts[-1].strip()
+    else:
+        # Fallback: use page title as job title and extract company from filename or URL
+        job_title = page_title
+        # Extract company from filename or URL
+        if "_jobs_" in filename:
+            company = filename.split("_jobs_")[0].title()
+        elif url and "boards.greenhouse.io/" in url:
+            # Extract from URL pattern: https://boards.greenhouse.io/company/jobs/123
+            url_match = _BOARDS_URL_RE.search(url)
+            if url_match:
+                company = url_match.group(1).title()
+            else:
+                company = "Unknown Company"
+        else:
+            company = "Unknown Company"
+    
+    # Look for JSON-LD structured data
+    json_ld_scripts = soup.find_all('script', type='application/ld+json')
+    compensation = None
+    
+    for script in json_ld_scripts:
+        # Only decode scripts that can actually hold a typed object
+        if not script.string or '"@type"' not in script.string:
+            continue
+        try:
+            data = orjson.loads(script.string.encode())
+            if data.get('@type') == 'JobPosting':
+                job_title, company, location, compensation = _parse_json_ld_job(data, job_title, company, location)
+                break
+        except (ValueError, TypeError, AttributeError):
+            continue
+    
+    # If location still not found, try all extraction methods and pick the best
+    if not location or location == "":
+        all_potential_locations = []
+        
+        # Strategy 1: Look for location in script tags
+        # Only scripts whose text holds JSON-like data with a location field are returned
+        script_tags = soup.find_all('script', string=_LOCATION_JSON_RE)
+        for script in script_tags:
+            # Extract location value from JSON-like structure
+            location_match = _LOCATION_JSON_RE.search(script.string)
+            if location_match:
+                potential_location = location_match.group(1).strip()
+                # Clean up location (remove trailing commas, etc.)
+                potential_location = potential_location.rstrip(',').strip()
+                # Validate it looks like a location
+                if len(potential_location) < 50 and _is_location_text(potential_location):
+                    all_potential_locations.append(potential_location)
+        
+        # Strategy 2: Look for common location selectors
+        location_selectors = [
+            'span.caption',  # Roblox uses this for location
+            'div.location',
+            '.location',
+            '[data-qa="job-location"]',
+            '.job-location',
+            'div[class*="location"]',
+            '.job-post-location',
+            '.posting-location',
+            'h4',  # Often contains full location info
+        ]
+        
+        for selector in location_selectors:
+            location_elems = soup.select(selector)
+            for elem in location_elems:
+                text = elem.get_text().strip()
+                # Check if this looks like a location and collect all candidates
+                if _is_location_text(text):
+                    all_potential_locations.append(text)
+        
+        # Choose the most specific location from all candidates
+        if all_potential_locations:
+            location = _choose_best_location(all_potential_locations)
+        
+        # Strategy 3: Look for h3 tags that might contain location
+        if not location:
+            h3_tags = soup.find_all('h3')
+            for h3 in h3_tags:
+                text = h3.get_text().strip()
+                # Check if this looks like a location (but not a job title)
+                if _is_location_text(text):
+                    location = text
+                    break
+        
+        # Strategy 4: Look for location in job description structure
+        if not location:
+            # Look for divs with text-section class (common in Greenhouse)
+            text_sections = soup.find_all('div', class_='text-section')
+            for section in text_sections:
+                text = section.get_text().strip()
+                # Extract location patterns from text
+                for pattern in _LOC_PATTERNS:
+                    match = pattern.search(text)
+                    if match:
+                        potential_location = match.group(1).strip()
+                        if len(potential_location) < 50 and _is_location_text(potential_location):
+                            location = potential_location
+                            break
+                if location:
+                    break
+    
+    # Skills extraction removed - using empty string
+    
+    # Extract compensation if not found in structured data
+    if not compensation:
+        compensation = _search_salary(soup.get_text())
+    
+    return _build_job(job_title, company, location, compensation, filename)
+
+def _parse_cached_page(html_content: bytes, filename: str):
+    """Parse one cached page, returning (job, error message) so one bad file doesn't abort a batch"""
+    try:
+        return _parse_job_html(html_content, filename), None
+    except (ValueError, TypeError, AttributeError, LookupError) as e:  # Malformed page or undecodable bytes
+        return None, str(e)
+
 class GreenhouseScraper:
-    def __init__(self, google_api_key: Optional[str] = None, google_cse_id: Optional[str] = None, use_cached_urls: bool = False):
+    def __init__(self, google_api_key: Optional[str] = None, google_cse_id: Optional[str] = None, use_cached_urls: bool = False,
+                 requests_per_host_per_second: float = 1.0):
         self.base_url = "https://boards.greenhouse.io"
         self.api_base_url = "https://boards-api.greenhouse.io/v1/boards"
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
-        self.rate_limit_delay = 1
+        # Larger keep-alive pool for concurrent requests, with backoff on transient errors
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,  # Comfortably above max_workers so pooled connections are never discarded
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        # Nearly every job page lives on boards.greenhouse.io, so this budget is effectively global
+        self.rate_limiter = HostRateLimiter(max_calls=1, period=1.0 / requests_per_host_per_second)
+        self.max_workers = 20  # Concurrent job page fetches
+        self.max_requests_per_host = 2  # Concurrent requests allowed against one host
+        self._host_slots = defaultdict(lambda: threading.BoundedSemaphore(self.max_requests_per_host))
+        self._host_slots_lock = threading.Lock()
         self.days_back = 14  # Default to jobs from past 2 weeks
         self.use_cached_urls = use_cached_urls
         self.use_cached_html = os.path.exists('html_cache')
+        self.parse_cache_file = 'job_parse_cache.json'
+        self.parse_cache_max_entries = 5000  # Least recently used results are dropped beyond this
+        self._parse_cache = None  # Loaded on first use
+        self._parse_cache_lock = threading.Lock()
+        self._parse_cache_dirty = False
         
         # Initialize Google Search Service
         if not use_cached_urls:
@@ -63,6 +492,7 @@ class GreenhouseScraper:
             if self.use_cached_html:
                 print("📄 Using cached HTML files for processing...")
                 jobs = self._process_cached_html()
+                self._save_parse_cache()
                 print(f"Processed {len(jobs)} jobs from cached HTML")
                 return jobs
             
@@ -81,20 +511,25 @@ class GreenhouseScraper:
             
             print(f"Found {len(job_urls)} job URLs, scraping details...")
             
-            # Extract job details using HTML parsing
-            for i, job_url in enumerate(job_urls, 1):
-                try:
-                    job = self._extract_job_from_url(job_url)
-                    if job:
-                        jobs.append(job)
-                        print(f"✅ {i}/{len(job_urls)}: {job.title} at {job.company}")
-                    else:
-                        print(f"❌ {i}/{len(job_urls)}: Not a job posting")
-                    
-                    time.sleep(self.rate_limit_delay)
-                except Exception as e:
-                    print(f"⚠️ {i}/{len(job_urls)}: Error - {e}")
-                    continue
+            # Extract job details using HTML parsing, fetching pages concurrently
+            results = {}
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = {executor.submit(self._extract_job_from_url, job_url): i for i, job_url in enumerate(job_urls, 1)}
+                for future in as_completed(futures):
+                    i = futures[future]
+                    try:
+                        job = future.result()
+                        if job:
+                            results[i] = job
+                            print(f"✅ {i}/{len(job_urls)}: {job.title} at {job.company}")
+                        else:
+                            print(f"❌ {i}/{len(job_urls)}: Not a job posting")
+                    except Exception as e:
+                        print(f"⚠️ {i}/{len(job_urls)}: Error - {e}")
+            
+            # Keep jobs in search result order
+            jobs = [results[i] for i in sorted(results)]
+            self._save_parse_cache()
                     
         except Exception as e:
             print(f"Error during Google search: {e}")
@@ -106,8 +541,8 @@ class GreenhouseScraper:
         """Save URLs to cache file for testing"""
         cache_file = 'test_urls.json'
         try:
-            with open(cache_file, 'w') as f:
-                json.dump(urls, f, indent=2)
+            with open(cache_file, 'wb') as f:
+                f.write(orjson.dumps(urls, option=orjson.OPT_INDENT_2))
             print(f"Saved {len(urls)} URLs to {cache_file}")
         except Exception as e:
             print(f"Failed to save URLs cache: {e}")
@@ -116,233 +551,157 @@ class GreenhouseScraper:
         """Load URLs from cache file"""
         cache_file = 'test_urls.json'
         try:
-            with open(cache_file, 'r') as f:
-                urls = json.load(f)
+            with open(cache_file, 'rb') as f:
+                urls = orjson.loads(f.read())
             return urls
         except Exception as e:
             print(f"Failed to load URLs cache: {e}")
             return []
     
+    def _load_parse_cache(self) -> dict:
+        """Load cached parse results from disk, discarding a file written by another parser version"""
+        try:
+            with open(self.parse_cache_file, 'rb') as f:
+                data = orjson.loads(f.read())
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            print(f"Failed to load parse cache: {e}")
+            return {}
+        
+        if isinstance(data, dict) and data.get('version') == _PARSE_CACHE_VERSION and isinstance(data.get('entries'), dict):
+            return data['entries']
+        
+        # Stale results can never be hit again, so drop the whole file
+        try:
+            os.remove(self.parse_cache_file)
+        except OSError:
+            pass
+        return {}
+    
+    def _parse_cache_entries(self) -> dict:
+        """Parse cache entries, loaded from disk the first time they are needed"""
+        with self._parse_cache_lock:
+            if self._parse_cache is None:
+                self._parse_cache = self._load_parse_cache()
+            return self._parse_cache
+    
+    def _save_parse_cache(self) -> None:
+        """Save parse results to disk if any were added, keeping only the most recently used"""
+        if not self._parse_cache_dirty:
+            return
+        with self._parse_cache_lock:
+            entries = self._parse_cache
+            excess = len(entries) - self.parse_cache_max_entries
+            for key in list(islice(entries, max(excess, 0))):
+                del entries[key]
+            payload = orjson.dumps({'version': _PARSE_CACHE_VERSION, 'entries': entries})
+        try:
+            with open(self.parse_cache_file, 'wb') as f:
+                f.write(payload)
+            self._parse_cache_dirty = False
+        except OSError as e:
+            print(f"Failed to save parse cache: {e}")
+    
     def _process_cached_html(self) -> List[JobPosting]:
         """Process jobs from cached HTML files"""
         cache_dir = "html_cache"
-        html_files = [f for f in os.listdir(cache_dir) if f.endswith('.html')]
         
-        jobs = []
-        for filename in html_files:
-            filepath = os.path.join(cache_dir, filename)
-            try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    html_content = f.read()
+        # Read substantial files, reusing cached results and collecting the rest to parse
+        results = []
+        pending = []
+        with os.scandir(cache_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith('.html'):
+                    continue
+                try:
+                    if entry.stat().st_size <= 1000:  # Only process substantial files
+                        continue
+                    with open(entry.path, 'rb') as f:
+                        html_content = f.read()
+                except OSError as e:
+                    print(f"Error processing {entry.name}: {e}")
+                    continue
                 
-                if len(html_content) > 1000:  # Only process substantial files
-                    job = self._extract_job_from_html(html_content, filename, url=None)
-                    if job:
-                        jobs.append(job)
-                        
-            except Exception as e:
-                print(f"Error processing {filename}: {e}")
-                continue
-        
-        return jobs
-    
-    def _extract_job_from_html(self, html_content: str, filename: str, url: str = None) -> Optional[JobPosting]:
-        """Extract job information from HTML content"""
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
-        # Extract title
-        title_tag = soup.find('title')
-        page_title = title_tag.get_text().strip() if title_tag else ""
-        
-        # Parse title for job info
-        job_title = ""
-        company = ""
-        location = ""
-        
-        if " - " in page_title:
-            parts = page_title.split(" - ")
-            if len(parts) >= 3:
-                job_title = parts[0].strip()
-                location = " - ".join(parts[1:-1]).strip()
-                company = parts[-1].strip()
-            elif len(parts) >= 2:
-                job_title = parts[0].strip()
-                company = parts[-1].strip()
-        else:
-            # Fallback: use page title as job title and extract company from filename or URL
-            job_title = page_title
-            # Extract company from filename or URL
-            if "_jobs_" in filename:
-                company = filename.split("_jobs_")[0].title()
-            elif url and "boards.greenhouse.io/" in url:
-                # Extract from URL pattern: https://boards.greenhouse.io/company/jobs/123
-                url_match = re.search(r'boards\.greenhouse\.io/([^/]+)/', url)
-                if url_match:
-                    company = url_match.group(1).title()
+                key = self._parse_cache_key(html_content, entry.name, None)
+                hit, job = self._cached_job(key)
+                if hit:
+                    results.append(job)
                 else:
-                    company = "Unknown Company"
-            else:
-                company = "Unknown Company"
-        
-        # Look for JSON-LD structured data
-        json_ld_scripts = soup.find_all('script', type='application/ld+json')
-        compensation = None
+                    results.append(None)
+                    pending.append((len(results) - 1, key, html_content, entry.name))
+        
+        # Parsing is CPU-bound, so spread larger batches across processes
+        contents = [html_content for _, _, html_content, _ in pending]
+        filenames = [filename for _, _, _, filename in pending]
+        if len(pending) > 16:
+            with ProcessPoolExecutor() as executor:
+                parsed = list(executor.map(_parse_cached_page, contents, filenames, chunksize=8))
+        else:
+            parsed = [_parse_cached_page(html_content, filename) for html_content, filename in zip(contents, filenames)]
         
-        for script in json_ld_scripts:
-            try:
-                data = json.loads(script.string)
-                if data.get('@type') == 'JobPosting':
-                    job_title = data.get('title', job_title).strip()
-                    if data.get('hiringOrganization'):
-                        company = data['hiringOrganization'].get('name', company)
-                    if data.get('jobLocation'):
-                        job_location = data['jobLocation']
-                        if isinstance(job_location, dict):
-                            location = job_location.get('address', location)
-                        elif isinstance(job_location, str):
-                            location = job_location
-                    
-                    # Extract compensation from structured data
-                    description = data.get('description', '')
-                    if 'pay range' in description.lower():
-                        salary_match = re.search(r'\$[\d,]+\s*[—\-]\s*\$[\d,]+', description)
-                        if salary_match:
-                            compensation = salary_match.group()
-                    break
-            except:
+        for (index, key, _, filename), (job, error) in zip(pending, parsed):
+            if error:
+                print(f"Error processing {filename}: {error}")
                 continue
+            self._remember_job(key, job)
+            results[index] = job
         
-        # If location still not found, try all extraction methods and pick the best
-        if not location or location == "":
-            all_potential_locations = []
-            
-            # Strategy 1: Look for location in script tags
-            script_tags = soup.find_all('script')
-            for script in script_tags:
-                script_text = script.get_text()
-                # Look for JSON-like data with location field
-                if '"location":"' in script_text:
-                    try:
-                        # Extract location value from JSON-like structure
-                        location_match = re.search(r'"location":"([^"]+)"', script_text)
-                        if location_match:
-                            potential_location = location_match.group(1).strip()
-                            # Clean up location (remove trailing commas, etc.)
-                            potential_location = potential_location.rstrip(',').strip()
-                            # Validate it looks like a location
-                            if len(potential_location) < 50 and self._is_location_text(potential_location):
-                                all_potential_locations.append(potential_location)
-                    except:
-                        continue
-            
-            # Strategy 2: Look for common location selectors
-            location_selectors = [
-                'span.caption',  # Roblox uses this for location
-                'div.location',
-                '.location',
-                '[data-qa="job-location"]',
-                '.job-location',
-                'div[class*="location"]',
-                '.job-post-location',
-                '.posting-location',
-                'h4',  # Often contains full location info
-            ]
-            
-            for selector in location_selectors:
-                location_elems = soup.select(selector)
-                for elem in location_elems:
-                    text = elem.get_text().strip()
-                    # Check if this looks like a location and collect all candidates
-                    if self._is_location_text(text):
-                        all_potential_locations.append(text)
-            
-            # Choose the most specific location from all candidates
-            if all_potential_locations:
-                location = self._choose_best_location(all_potential_locations)
-            
-            # Strategy 3: Look for h3 tags that might contain location
-            if not location:
-                h3_tags = soup.find_all('h3')
-                for h3 in h3_tags:
-                    text = h3.get_text().strip()
-                    # Check if this looks like a location (but not a job title)
-                    if self._is_location_text(text):
-                        location = text
-                        break
-            
-            # Strategy 4: Look for location in job description structure
-            if not location:
-                # Look for divs with text-section class (common in Greenhouse)
-                text_sections = soup.find_all('div', class_='text-section')
-                for section in text_sections:
-                    text = section.get_text().strip()
-                    # Extract location patterns from text
-                    location_patterns = [
-                        r'([^,]+,\s*[A-Z]{2}(?:,\s*United States)?)',  # City, State or City, State, United States
-                        r'(Remote\s*[-–—]?\s*[^,\n]*)',  # Remote variations
-                        r'([A-Z][a-z]+,\s*[A-Z]{2})',  # Simple City, State
-                    ]
-                    
-                    for pattern in location_patterns:
-                        match = re.search(pattern, text)
-                        if match:
-                            potential_location = match.group(1).strip()
-                            if len(potential_location) < 50 and self._is_location_text(potential_location):
-                                location = potential_location
-                                break
-                    if location:
-                        break
-        
-        # Skills extraction removed - using empty string
-        
-        # Extract compensation if not found in structured data
-        if not compensation:
-            salary_patterns = [
-                r'\$[\d,]+\s*[-–—]\s*\$[\d,]+',
-                r'\$[\d,]+k?\s*-\s*\$[\d,]+k?'
-            ]
-            for pattern in salary_patterns:
-                match = re.search(pattern, soup.get_text())
-                if match:
-                    compensation = match.group()
-                    break
-        
-        # Validate and clean location before returning
-        if location and job_title:
-            # Don't use location if it's the same as job title or contains job title
-            if (location.lower() == job_title.lower() or 
-                job_title.lower() in location.lower() or
-                any(word in location.lower() for word in ['scientist', 'engineer', 'manager', 'director', 'senior', 'staff', 'principal', 'data'])):
-                location = ""
-        
-        # Only return if we have meaningful data
-        if job_title and company and len(job_title) > 3:
-            return JobPosting(
-                title=job_title,
-                company=company,
-                url=filename,  # Use filename as URL for cached HTML
-                location=location or "Location not specified",
-                technical_skills="",
-                compensation=compensation
-            )
-        
-        return None
+        return [job for job in results if job]
+    
+    def _parse_cache_key(self, html_content: Union[str, bytes], filename: str, url: Optional[str]) -> str:
+        """Key a page's parse result on its content, filename and URL"""
+        content = html_content.encode('utf-8') if isinstance(html_content, str) else html_content
+        key = hashlib.blake2b(content, digest_size=8)
+        key.update(f"\0{filename}\0{url}".encode())
+        return key.hexdigest()
+    
+    def _cached_job(self, key: str):
+        """Return (hit, job) for a cache key, marking a hit as recently used"""
+        entries = self._parse_cache_entries()
+        with self._parse_cache_lock:
+            if key not in entries:
+                return False, None
+            cached = entries[key] = entries.pop(key)
+        return True, (JobPosting(**cached) if cached else None)
+    
+    def _remember_job(self, key: str, job: Optional[JobPosting]) -> None:
+        entries = self._parse_cache_entries()
+        with self._parse_cache_lock:
+            entries[key] = asdict(job) if job else None
+            self._parse_cache_dirty = True
     
+    def _extract_job_from_html(self, html_content: Union[str, bytes], filename: str, url: str = None) -> Optional[JobPosting]:
+        """Extract job information from HTML content, reusing the result for pages seen before"""
+        key = self._parse_cache_key(html_content, filename, url)
+        hit, job = self._cached_job(key)
+        if hit:
+            return job
+        
+        job = _parse_job_html(html_content, filename, url=url)
+        self._remember_job(key, job)
+        return job
+    
+    def _host_slot(self, url: str) -> threading.BoundedSemaphore:
+        """Semaphore limiting concurrent requests to the URL's host"""
+        with self._host_slots_lock:
+            return self._host_slots[urlsplit(url).netloc]
     
     def _extract_job_from_url(self, job_url: str) -> Optional[JobPosting]:
         """Extract job information from a URL using HTML parsing"""
         try:
-            response = self.session.get(job_url, timeout=10)
+            with self._host_slot(job_url):
+                self.rate_limiter.wait(job_url)
+                response = self.session.get(job_url, timeout=10)
             response.raise_for_status()
             
             # Use the same HTML extraction logic
             filename = job_url.split('/')[-1]
-            job = self._extract_job_from_html(response.content.decode('utf-8'), filename, url=job_url)
+            job = self._extract_job_from_html(response.content, filename, url=job_url)
             
             if job:
-                # Update URL to be the actual URL instead of filename
-                job.url = job_url
-                return job
+                # Use the actual URL instead of filename
+                return replace(job, url=job_url)
                 
         except Exception as e:
             print(f"Error extracting job from {job_url}: {e}")
@@ -350,108 +709,31 @@ class GreenhouseScraper:
         return None
     
     def _is_location_text(self, text: str) -> bool:
-        """Check if text looks like a location"""
-        if not text or len(text) > 100 or len(text) < 2:
-            return False
-        
-        # Skip if it contains job-related or non-location keywords
-        non_location_keywords = [
-            'scientist', 'engineer', 'manager', 'director', 'senior', 'staff', 'principal', 'data', 'analyst', 'developer',
-            'careers', 'jobs', 'opportunities', 'openings', 'positions', 'apply', 'team', 'department',
-            'benefits', 'salary', 'compensation', 'experience', 'requirements', 'qualifications'
-        ]
-        if any(keyword in text.lower() for keyword in non_location_keywords):
-            return False
-        
-        # Check for location indicators
-        location_indicators = [
-            'remote', 'hybrid', 'office',
-            'india', 'usa', 'united states', 'america',
-            'california', 'texas', 'new york', 'florida', 'washington', 'massachusetts',
-            'san francisco', 'new york', 'boston', 'seattle', 'austin', 'chicago', 'los angeles',
-            'london', 'toronto', 'sydney', 'berlin', 'amsterdam',
-            'ca', 'ny', 'tx', 'fl', 'wa', 'ma'
-        ]
-        
-        text_lower = text.lower()
-        return any(indicator in text_lower for indicator in location_indicators)
+        return _is_location_text(text)
     
     def _choose_best_location(self, locations: list) -> str:
-        """Choose the most specific/useful location from a list of candidates"""
-        if not locations:
-            return ""
-        
-        # Remove duplicates while preserving order
-        unique_locations = []
-        for loc in locations:
-            if loc not in unique_locations:
-                unique_locations.append(loc)
-        
-        # Scoring system for location specificity
-        def location_score(loc):
-            score = 0
-            loc_lower = loc.lower()
-            
-            # City names (highest priority)
-            cities = ['san francisco', 'new york', 'boston', 'seattle', 'austin', 'chicago', 'los angeles', 'denver', 'atlanta', 'miami']
-            for city in cities:
-                if city in loc_lower:
-                    score += 100
-            
-            # Contains city, state pattern
-            if ',' in loc and any(state in loc_lower for state in ['california', 'texas', 'new york', 'florida', 'washington', 'massachusetts']):
-                score += 80
-            
-            # State abbreviations with comma (e.g., "San Francisco, CA")
-            if re.search(r',\s*[A-Z]{2}(\s|$)', loc):
-                score += 70
-            
-            # Remote indicators
-            if 'remote' in loc_lower:
-                score += 60
-            
-            # Specific countries/regions
-            if 'india' in loc_lower:
-                score += 50
-            
-            # State names
-            states = ['california', 'texas', 'new york', 'florida', 'washington', 'massachusetts']
-            if any(state in loc_lower for state in states):
-                score += 40
-            
-            # Generic country names (lower priority)
-            if loc_lower in ['united states', 'usa', 'america']:
-                score += 10
-            
-            # Penalty for very short locations (likely abbreviations taken out of context)
-            if len(loc) <= 3:
-                score -= 20
-            
-            return score
-        
-        # Sort by score (highest first)
-        scored_locations = [(loc, location_score(loc)) for loc in unique_locations]
-        scored_locations.sort(key=lambda x: x[1], reverse=True)
-        
-        # Return the highest scoring location
-        best_location = scored_locations[0][0]
-        return best_location
+        return _choose_best_location(locations)
     
     def _scrape_company_jobs_api(self, company: str) -> List[JobPosting]:
         """Try to scrape jobs using Greenhouse API first"""
         api_url = f"{self.api_base_url}/{company}/jobs"
         
         try:
+            self.rate_limiter.wait(api_url)
             response = self.session.get(api_url, timeout=10)
             if response.status_code == 200:
-                data = response.json()
+                payload = orjson.loads(response.content)
+                raw_jobs = payload.get('jobs') if isinstance(payload, dict) else None
+                if not isinstance(raw_jobs, list):
+                    return []
+                
                 jobs = []
-                for job_data in data.get('jobs', []):
+                for job_data in raw_jobs:
                     job = self._parse_api_job(job_data, company)
                     if job:
                         jobs.append(job)
                 return jobs
-        except Exception:
+        except (requests.RequestException, ValueError):
             pass
         
         return []
@@ -468,8 +750,8 @@ class GreenhouseScraper:
             if job_data.get('location'):
                 location = job_data['location'].get('name', 'Unknown Location')
             
-            content = job_data.get('content', '')
-            description = BeautifulSoup(content, 'html.parser').get_text(strip=True) if content else ''
+            content = job_data.get('content')
+            description = _html_text(content) if content and content.strip() else ''
             
             compensation = self._extract_compensation(description)
             
@@ -495,15 +777,16 @@ class GreenhouseScraper:
         url = f"{self.base_url}/{company}"
         
         try:
+            self.rate_limiter.wait(url)
             response = self.session.get(url, timeout=10)
             response.raise_for_status()
         except requests.RequestException as e:
             return []
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(response.content, 'lxml')
         jobs = []
         
-        job_links = soup.find_all('a', href=re.compile(r'/jobs/\d+'))
+        job_links = soup.find_all('a', href=_JOBS_NUM_RE)
         
         for link in job_links[:3]:  # Limit to first 3 jobs per company for performance
             try:
@@ -511,7 +794,6 @@ class GreenhouseScraper:
                 job = self._scrape_job_details(job_url, company)
                 if job:
                     jobs.append(job)
-                time.sleep(self.rate_limit_delay)
             except Exception as e:
                 print(f"Error scraping job {link.get('href')}: {e}")
                 continue
@@ -521,28 +803,32 @@ class GreenhouseScraper:
     def _scrape_job_from_url(self, job_url: str) -> Optional[JobPosting]:
         """Scrape job details from a Greenhouse job URL"""
         # Extract company name from URL
-        company_match = re.search(r'boards\.greenhouse\.io/([^/]+)', job_url)
+        company_match = _BOARDS_COMPANY_RE.search(job_url)
         company = company_match.group(1) if company_match else "Unknown Company"
         
         return self._scrape_job_details(job_url, company)
     
     def _scrape_job_details(self, job_url: str, company: str) -> Optional[JobPosting]:
         try:
+            self.rate_limiter.wait(job_url)
             response = self.session.get(job_url, timeout=10)
             response.raise_for_status()
         except requests.RequestException:
             return None
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        try:
+            tree = _html_tree(response.content)
+        except ParserError:  # Empty or comment-only page
+            tree = lxml.html.fromstring('<html></html>')
         
-        title_elem = soup.find('h1')
-        title = title_elem.text.strip() if title_elem else "Unknown Title"
+        title_elem = tree.find('.//h1')
+        title = _inline_text(title_elem) if title_elem is not None else "Unknown Title"
         
-        location_elem = soup.find('div', {'class': 'location'})
-        location = location_elem.text.strip() if location_elem else "Unknown Location"
+        location_elem = next((e for e in tree.find_class('location') if e.tag == 'div'), None)
+        location = _inline_text(location_elem) if location_elem is not None else "Unknown Location"
         
-        description_elem = soup.find('div', {'id': 'content'})
-        description = description_elem.get_text(strip=True) if description_elem else ""
+        description_elem = tree.get_element_by_id('content', None)
+        description = _element_text(description_elem) if description_elem is not None and description_elem.tag == 'div' else ""
         
         compensation = self._extract_compensation(description)
         
@@ -556,19 +842,12 @@ class GreenhouseScraper:
         )
     
     def _extract_compensation(self, description: str) -> Optional[str]:
-        salary_patterns = [
-            r'\$[\d,]+\s*-\s*\$[\d,]+',
-            r'\$[\d,]+k?\s*-\s*\$[\d,]+k?',
-            r'salary:?\s*\$[\d,]+',
-            r'compensation:?\s*\$[\d,]+'
-        ]
-        
-        for pattern in salary_patterns:
-            match = re.search(pattern, description, re.IGNORECASE)
-            if match:
-                return match.group(0)
+        # Every pattern needs a dollar sign, so skip the regex when there is none
+        if '$' not in description:
+            return None
         
-        return None
+        match = _COMP_RE.search(description)
+        return match.group(0) if match else None
     
     def _filter_recent_jobs(self, jobs: List[JobPosting]) -> List[JobPosting]:
         """Filter jobs to only include those posted in the past week"""
@@ -0,0 +1,54 @@
+import threading
+import time
+from collections import deque
+from urllib.parse import urlsplit
+
+
+class RateLimiter:
+    """Thread-safe limiter allowing at most max_calls requests per period seconds
+
+    Unlike a fixed sleep after every request, callers only wait when the
+    recent request rate actually exceeds the budget.
+    """
+
+    def __init__(self, max_calls: int, period: float = 1.0):
+        self.max_calls = max_calls
+        self.period = period
+        self._calls = deque()
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        """Block until another request fits in the budget, then record it"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._calls and now - self._calls[0] >= self.period:
+                    self._calls.popleft()
+                if len(self._calls) < self.max_calls:
+                    self._calls.append(now)
+                    return
+                delay = self.period - (now - self._calls[0])
+            time.sleep(delay)
+
+
+class HostRateLimiter:
+    """Keeps a separate RateLimiter budget for each host
+
+    Requests to different hosts never wait on each other; only requests to
+    the same host share a max_calls-per-period window.
+    """
+
+    def __init__(self, max_calls: int, period: float = 1.0):
+        self.max_calls = max_calls
+        self.period = period
+        self._limiters = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url: str) -> None:
+        """Block until another request to url's host fits in its budget"""
+        host = urlsplit(url).netloc
+        with self._lock:
+            limiter = self._limiters.get(host)
+            if limiter is None:
+                limiter = self._limiters[host] = RateLimiter(self.max_calls, self.period)
+        limiter.wait()
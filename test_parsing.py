@@ -4,19 +4,177 @@ Test Parsing Script
 Uses test_urls.json to test HTML parsing improvements efficiently
 """
 
-import json
+import argparse
+import asyncio
+import hashlib
+import orjson
+import os
+import re
+import time
 import requests
+import soupsieve
+from requests.adapters import HTTPAdapter
+from collections import defaultdict
 from bs4 import BeautifulSoup
 from src.job_curator.scraper.greenhouse import GreenhouseScraper
 
 
-def test_location_extraction():
+# Location keywords to look for in page text, matched as whole words in one pass
+LOCATION_KEYWORDS = ['India', 'Remote', 'San Francisco', 'New York', 'Boston', 'Seattle', 'USA', 'United States', 'CA', 'NY']
+KEYWORD_RE = re.compile(r'\b(' + '|'.join(map(re.escape, LOCATION_KEYWORDS)) + r')\b')
+KEYWORD_LINE_RE = re.compile(r'^.*?' + KEYWORD_RE.pattern + r'.*$', re.MULTILINE)
+
+# JSON-LD script bodies, matched on the raw page bytes
+JSONLD_RE = re.compile(rb'<script[^>]*application/ld\+json[^>]*>(.*?)</script>', re.DOTALL | re.IGNORECASE)
+
+# Keywords whose surrounding HTML structure is reported, matched as substrings like before
+STRUCTURE_KEYWORDS = ['India', 'Remote', 'San Francisco']
+STRUCTURE_KEYWORD_RE = re.compile('|'.join(map(re.escape, STRUCTURE_KEYWORDS)))
+
+# Location selectors to report on, compiled once both individually and as one group
+LOCATION_SELECTORS = [
+    'div.location', '.location', '[data-qa="job-location"]',
+    '.job-location', 'div[class*="location"]'
+]
+LOCATION_SELECTOR_PATTERNS = [(selector, soupsieve.compile(selector)) for selector in LOCATION_SELECTORS]
+LOCATION_SELECTOR_GROUP = soupsieve.compile(', '.join(LOCATION_SELECTORS))
+
+# One keep-alive connection pool shared by every test fetch
+SESSION = requests.Session()
+SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+})
+SESSION.mount('https://', HTTPAdapter(pool_connections=20, pool_maxsize=20))
+SESSION.mount('http://', HTTPAdapter(pool_connections=20, pool_maxsize=20))
+
+# Fetched pages are kept on disk so re-runs while tuning the parser skip the network
+TEST_CACHE_DIR = '.test_cache'
+TEST_CACHE_TTL = 24 * 60 * 60  # Seconds before a cached page is fetched again
+
+_SCRAPER = None  # Built lazily by _get_scraper()
+
+
+def _get_scraper() -> GreenhouseScraper:
+    """Scraper shared by the tests, created on first use"""
+    global _SCRAPER
+    if _SCRAPER is None:
+        _SCRAPER = GreenhouseScraper(use_cached_urls=True)
+    return _SCRAPER
+
+
+def _cache_path(url: str, suffix: str) -> str:
+    """Path of a test cache entry for a URL"""
+    key = hashlib.sha1(url.encode()).hexdigest()
+    return os.path.join(TEST_CACHE_DIR, f"{key}{suffix}")
+
+
+def _fetch_html(url: str, use_cache: bool = True) -> bytes:
+    """Return a page body, from the on-disk test cache when a fresh copy exists"""
+    cache_path = _cache_path(url, '.html')
+    
+    if use_cache:
+        try:
+            if time.time() - os.path.getmtime(cache_path) < TEST_CACHE_TTL:
+                with open(cache_path, 'rb') as f:
+                    return f.read()
+        except OSError:
+            pass  # Not cached yet
+    
+    # Read the body in one call from the stream instead of joining requests' content chunks
+    with SESSION.get(url, timeout=10, stream=True) as response:
+        response.raise_for_status()
+        content = response.raw.read(decode_content=True)
+    
+    os.makedirs(TEST_CACHE_DIR, exist_ok=True)
+    with open(cache_path, 'wb') as f:
+        f.write(content)
+    return content
+
+
+def _try_jsonld(content: bytes):
+    """Return the first JSON-LD JobPosting dict in a raw page, found without building a DOM"""
+    for i, match in enumerate(JSONLD_RE.finditer(content)):
+        script = match.group(1)
+        # Org, breadcrumb and other schema blobs are skipped without being decoded
+        if b'"JobPosting"' not in script:
+            continue
+        try:
+            data = orjson.loads(script)
+            if data.get('@type') == 'JobPosting':
+                return data
+        except Exception as e:
+            print(f"   Error parsing JSON-LD {i}: {e}")
+    return None
+
+
+def _load_job_posting_ld(url: str, content: bytes, use_cache: bool = True):
+    """Return the page's JSON-LD JobPosting dict (or None), cached next to the page HTML"""
+    cache_path = _cache_path(url, '.jsonld.json')
+    
+    # Reuse the parsed data as long as it is no older than the cached page it came from
+    if use_cache:
+        try:
+            if os.path.getmtime(cache_path) >= os.path.getmtime(_cache_path(url, '.html')):
+                with open(cache_path, 'rb') as f:
+                    return orjson.loads(f.read())
+        except OSError:
+            pass  # Not cached yet
+    
+    job_posting = _try_jsonld(content)
+    
+    os.makedirs(TEST_CACHE_DIR, exist_ok=True)
+    with open(cache_path, 'wb') as f:
+        f.write(orjson.dumps(job_posting))
+    return job_posting
+
+
+async def _fetch_and_extract(scraper: GreenhouseScraper, url: str, use_cache: bool = True):
+    """Fetch a job page and run the scraper's HTML extraction on it"""
+    # Both steps run in worker threads, so parsing one page overlaps fetching the next
+    content = await asyncio.to_thread(_fetch_html, url, use_cache)
+    
+    # Extract job info using our HTML parsing method
+    html_text = content.decode('utf-8', errors='replace')
+    filename = url.split('/')[-1]
+    return await asyncio.to_thread(scraper._extract_job_from_html, html_text, filename, url=url)
+
+
+async def _extract_sample(scraper: GreenhouseScraper, urls: list, use_cache: bool = True):
+    """Fetch and parse every URL concurrently, reporting each as soon as it finishes"""
+    async def run(i, url):
+        try:
+            return i, url, await _fetch_and_extract(scraper, url, use_cache), None
+        except Exception as e:
+            return i, url, None, e
+    
+    for result in asyncio.as_completed([run(i, url) for i, url in enumerate(urls, 1)]):
+        i, url, job, error = await result
+        print(f"\n📄 Test {i}/{len(urls)}: {url}")
+        
+        if error:
+            print(f"   💥 Error: {error}")
+        elif job:
+            print(f"   ✅ Title: {job.title}")
+            print(f"   🏢 Company: {job.company}")
+            print(f"   📍 Location: {job.location}")
+            print(f"   💰 Compensation: {job.compensation or 'Not specified'}")
+            
+            # Highlight location extraction success
+            if job.location and job.location != "Location not specified":
+                print(f"   🎯 Location extracted successfully!")
+            else:
+                print(f"   ⚠️ Location not found")
+        else:
+            print(f"   ❌ No job info extracted")
+
+
+def test_location_extraction(use_cache: bool = True):
     """Test location extraction with URLs from test_urls.json"""
     
     # Load test URLs
     try:
-        with open('test_urls.json', 'r') as f:
-            test_urls = json.load(f)
+        with open('test_urls.json', 'rb') as f:
+            test_urls = orjson.loads(f.read())
     except FileNotFoundError:
         print("❌ test_urls.json not found")
         return
@@ -25,126 +183,109 @@ def test_location_extraction():
     print("=" * 50)
     
     # Create scraper instance for HTML extraction method
-    scraper = GreenhouseScraper(use_cached_urls=True)
+    scraper = _get_scraper()
     
     # Test first 5 URLs for quick feedback
     test_urls_sample = test_urls[:5]
-    
-    for i, url in enumerate(test_urls_sample, 1):
-        print(f"\n📄 Test {i}/5: {url}")
-        
-        try:
-            # Get HTML content
-            response = scraper.session.get(url, timeout=10)
-            response.raise_for_status()
-            
-            # Extract job info using our HTML parsing method
-            filename = url.split('/')[-1]
-            job = scraper._extract_job_from_html(response.content.decode('utf-8'), filename, url=url)
-            
-            if job:
-                print(f"   ✅ Title: {job.title}")
-                print(f"   🏢 Company: {job.company}")
-                print(f"   📍 Location: {job.location}")
-                print(f"   💰 Compensation: {job.compensation or 'Not specified'}")
-                
-                # Highlight location extraction success
-                if job.location and job.location != "Location not specified":
-                    print(f"   🎯 Location extracted successfully!")
-                else:
-                    print(f"   ⚠️ Location not found")
-            else:
-                print(f"   ❌ No job info extracted")
-                
-        except Exception as e:
-            print(f"   💥 Error: {e}")
+    asyncio.run(_extract_sample(scraper, test_urls_sample, use_cache))
     
     print(f"\n✅ Location extraction test complete")
 
 
-def test_specific_url_parsing(url):
+def test_specific_url_parsing(url, use_cache: bool = True):
     """Test parsing for a specific URL with detailed debugging"""
     
     print(f"🔍 Detailed Parsing Test for: {url}")
     print("=" * 60)
     
     try:
-        scraper = GreenhouseScraper(use_cached_urls=True)
-        response = scraper.session.get(url, timeout=10)
-        response.raise_for_status()
+        scraper = _get_scraper()
+        content = _fetch_html(url, use_cache)
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        # Decode the body once and feed both the debug parse and the extractor from it
+        html_text = content.decode('utf-8', errors='replace')
+        
+        soup = BeautifulSoup(html_text, 'lxml')
         
         # Debug title extraction
         print("📋 Title Analysis:")
         title_tag = soup.find('title')
+        title_text = title_tag.get_text() if title_tag else ""
         if title_tag:
-            print(f"   Page Title: {title_tag.get_text().strip()}")
+            print(f"   Page Title: {title_text.strip()}")
         
         # Debug JSON-LD data
         print("\n📊 JSON-LD Analysis:")
-        json_ld_scripts = soup.find_all('script', type='application/ld+json')
-        for i, script in enumerate(json_ld_scripts):
-            try:
-                data = json.loads(script.string)
-                if data.get('@type') == 'JobPosting':
-                    print(f"   JobPosting found:")
-                    print(f"     Title: {data.get('title')}")
-                    print(f"     jobLocation: {data.get('jobLocation')}")
-                    if data.get('jobLocation'):
-                        loc = data['jobLocation']
-                        if isinstance(loc, dict):
-                            print(f"     Location address: {loc.get('address')}")
-                        else:
-                            print(f"     Location value: {loc}")
-                    break
-            except Exception as e:
-                print(f"   Error parsing JSON-LD {i}: {e}")
+        data = _load_job_posting_ld(url, content, use_cache)
+        if data:
+            print(f"   JobPosting found:")
+            print(f"     Title: {data.get('title')}")
+            print(f"     jobLocation: {data.get('jobLocation')}")
+            if data.get('jobLocation'):
+                loc = data['jobLocation']
+                if isinstance(loc, dict):
+                    print(f"     Location address: {loc.get('address')}")
+                else:
+                    print(f"     Location value: {loc}")
         
         # Debug location selectors
         print("\n🎯 Location Selector Analysis:")
-        location_selectors = [
-            'div.location', '.location', '[data-qa="job-location"]',
-            '.job-location', 'div[class*="location"]'
-        ]
+        # One walk with the grouped selector, then attribute the few hits to their selectors
+        selector_hits = {selector: [] for selector in LOCATION_SELECTORS}
+        for elem in LOCATION_SELECTOR_GROUP.select(soup):
+            for selector, compiled in LOCATION_SELECTOR_PATTERNS:
+                if len(selector_hits[selector]) < 3 and compiled.match(elem):
+                    selector_hits[selector].append(elem)
         
-        for selector in location_selectors:
-            elements = soup.select(selector)
+        for selector, elements in selector_hits.items():
             if elements:
-                print(f"   {selector}: {[elem.get_text().strip() for elem in elements[:3]]}")
+                print(f"   {selector}: {[elem.get_text().strip() for elem in elements]}")
         
         # Debug text content for location keywords
         print("\n🔍 Location Keywords in Text:")
-        text_content = soup.get_text()
-        location_keywords = ['India', 'Remote', 'San Francisco', 'New York', 'Boston', 'Seattle', 'USA', 'United States', 'CA', 'NY']
+        # Separate strings with newlines so adjacent tags don't run together into one word
+        text_content = soup.get_text('\n')
+        # Capture every line holding a keyword in one pass, then attribute the
+        # keywords within just those lines
+        matches = set()
+        contexts = defaultdict(list)
+        for m in KEYWORD_LINE_RE.finditer(text_content):
+            line = m.group(0).strip()
+            for keyword in dict.fromkeys(KEYWORD_RE.findall(line)):
+                matches.add(keyword)
+                if len(line) < 100:
+                    contexts[keyword].append(line)
         
-        for keyword in location_keywords:
-            if keyword in text_content:
+        for keyword in LOCATION_KEYWORDS:
+            if keyword in matches:
                 print(f"   Found '{keyword}' in text")
                 # Show context around the keyword
-                lines = text_content.split('\n')
-                for line in lines:
-                    if keyword in line and len(line.strip()) < 100:
-                        print(f"     Context: {line.strip()}")
+                for line in contexts[keyword]:
+                    print(f"     Context: {line}")
         
         # Debug HTML structure around location
         print("\n🏗️ HTML Structure Analysis:")
-        # Look for any elements containing location keywords
-        for keyword in ['India', 'Remote', 'San Francisco']:
-            if keyword in text_content:
-                elements = soup.find_all(string=lambda text: text and keyword in text)
-                for i, element in enumerate(elements[:3]):
-                    if element.parent:
-                        parent_tag = element.parent.name
-                        parent_class = element.parent.get('class', [])
-                        parent_id = element.parent.get('id', '')
-                        print(f"   '{keyword}' found in <{parent_tag}> class={parent_class} id={parent_id}")
-                        print(f"     Text: {element.strip()[:100]}")
+        # Look for any elements containing location keywords, in one walk over the strings
+        keyword_elements = {keyword: [] for keyword in STRUCTURE_KEYWORDS if keyword in matches}
+        if keyword_elements:
+            for element in soup.find_all(string=STRUCTURE_KEYWORD_RE):
+                for keyword in set(STRUCTURE_KEYWORD_RE.findall(element)):
+                    if keyword in keyword_elements:
+                        keyword_elements[keyword].append(element)
+        
+        for keyword, elements in keyword_elements.items():
+            for i, element in enumerate(elements[:3]):
+                if element.parent:
+                    parent_tag = element.parent.name
+                    parent_class = element.parent.get('class', [])
+                    parent_id = element.parent.get('id', '')
+                    print(f"   '{keyword}' found in <{parent_tag}> class={parent_class} id={parent_id}")
+                    print(f"     Text: {element.strip()[:100]}")
         
         # Debug why extraction might be failing
         print("\n🚨 Extraction Debugging:")
-        if " - " in soup.find('title').get_text():
-            parts = soup.find('title').get_text().split(" - ")
+        if " - " in title_text:
+            parts = title_text.split(" - ")
             print(f"   Title parts: {parts}")
         else:
             print("   No ' - ' found in title for parsing")
@@ -152,7 +293,7 @@ def test_specific_url_parsing(url):
         # Test actual extraction
         print(f"\n🧪 Final Extraction Result:")
         filename = url.split('/')[-1]
-        job = scraper._extract_job_from_html(response.content.decode('utf-8'), filename, url=url)
+        job = scraper._extract_job_from_html(html_text, filename, url=url)
         
         if job:
             print(f"   Title: {job.title}")
@@ -167,12 +308,14 @@ def test_specific_url_parsing(url):
 
 
 if __name__ == "__main__":
-    import sys
+    parser = argparse.ArgumentParser(description="Test HTML parsing against live job pages")
+    parser.add_argument('url', nargs='?', help="Run the detailed parsing test for this URL")
+    parser.add_argument('--no-cache', action='store_true', help=f"Always re-fetch pages instead of using {TEST_CACHE_DIR}/")
+    args = parser.parse_args()
     
-    if len(sys.argv) > 1:
+    if args.url:
         # Test specific URL if provided
-        test_url = sys.argv[1]
-        test_specific_url_parsing(test_url)
+        test_specific_url_parsing(args.url, use_cache=not args.no_cache)
     else:
         # Run general location extraction test
-        test_location_extraction()
\ No newline at end of file
+        test_location_extraction(use_cache=not args.no_cache)
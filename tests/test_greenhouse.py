@@ -0,0 +1,190 @@
+import os
+import tempfile
+import unittest
+
+import orjson
+
+from src.job_curator.scraper.greenhouse import (
+    GreenhouseScraper,
+    _extract_job_from_json_ld,
+    _parse_job_html,
+)
+
+# A complete JobPosting the JSON-LD fast path accepts, with no salary in its description
+JOB_LD = (
+    '<script type="application/ld+json">'
+    '{"@type": "JobPosting", "title": "Data Scientist", "hiringOrganization": {"name": "Acme"},'
+    ' "jobLocation": "Boston, MA", "description": "&lt;p&gt;Build models.&lt;/p&gt;"}'
+    '</script>'
+)
+
+
+def _page(head: str, body: str = "") -> bytes:
+    """Wrap markup in a page large enough to look like a real job posting"""
+    filler = "<p>" + "filler text " * 100 + "</p>"
+    return f"<html><head>{head}</head><body>{body}{filler}</body></html>".encode()
+
+
+class ParseJobHtmlTest(unittest.TestCase):
+    def test_json_ld_without_location_is_read_by_full_parse(self):
+        # No location, so the JSON-LD fast path declines and the full parse must read the script
+        html_content = _page(
+            '<title>Careers</title>'
+            '<script type="application/ld+json">'
+            '{"@type": "JobPosting", "title": "Staff Analyst", "hiringOrganization": {"name": "Zed"}}'
+            '</script>'
+        )
+
+        job = _parse_job_html(html_content, "other.html")
+
+        self.assertIsNotNone(job)
+        self.assertEqual(job.title, "Staff Analyst")
+        self.assertEqual(job.company, "Zed")
+
+
+class JsonLdFastPathTest(unittest.TestCase):
+    def test_salary_split_by_tags_is_found(self):
+        job = _extract_job_from_json_ld(_page(JOB_LD, '<p><b>$120,000</b> - <b>$140,000</b></p>'), "acme_jobs_1.html")
+        self.assertEqual(job.compensation, "$120,000 - $140,000")
+
+    def test_salary_with_entity_dash_is_found(self):
+        job = _extract_job_from_json_ld(_page(JOB_LD, '<p>$120,000 &ndash; $140,000</p>'), "acme_jobs_1.html")
+        self.assertEqual(job.compensation, "$120,000 – $140,000")
+
+    def test_utf8_page_without_charset_keeps_its_dash(self):
+        job = _extract_job_from_json_ld(_page(JOB_LD, '<p>$100,000 – $120,000</p>'), "acme_jobs_1.html")
+        self.assertEqual(job.compensation, "$100,000 – $120,000")
+
+    def test_salary_in_description_markup_is_found(self):
+        ld = JOB_LD.replace("Build models.", "Pay: &lt;b&gt;$90,000&lt;/b&gt; - &lt;b&gt;$110,000&lt;/b&gt;")
+        job = _extract_job_from_json_ld(_page(ld), "acme_jobs_1.html")
+        self.assertEqual(job.compensation, "$90,000 - $110,000")
+
+    def test_dollar_ranges_outside_page_text_are_ignored(self):
+        page = _page(JOB_LD + '<meta name="x" content="$1 - $2"><script>var r = "$3 - $4";</script>')
+        job = _extract_job_from_json_ld(page, "acme_jobs_1.html")
+        self.assertIsNone(job.compensation)
+
+    def test_commented_out_json_ld_is_ignored(self):
+        stale = JOB_LD.replace("Data Scientist", "Old Role").replace("Acme", "Old Co")
+        job = _extract_job_from_json_ld(_page("<!-- " + stale + " -->" + JOB_LD), "acme_jobs_1.html")
+        self.assertEqual((job.title, job.company), ("Data Scientist", "Acme"))
+
+
+class ParseApiJobTest(unittest.TestCase):
+    def setUp(self):
+        self.scraper = GreenhouseScraper(use_cached_urls=True)
+
+    def test_null_content_gives_empty_description(self):
+        job = self.scraper._parse_api_job({'title': 'Engineer', 'content': None}, 'acme')
+        self.assertEqual((job.title, job.technical_skills), ('Engineer', ''))
+
+    def test_comment_only_content_gives_empty_description(self):
+        job = self.scraper._parse_api_job({'title': 'Engineer', 'content': '<!-- draft -->'}, 'acme')
+        self.assertEqual(job.technical_skills, '')
+
+
+class _FakeResponse:
+    status_code = 200
+
+    def __init__(self, content: bytes):
+        self.content = content
+
+    def raise_for_status(self):
+        pass
+
+
+class _FakeSession:
+    def __init__(self, content: bytes):
+        self.content = content
+
+    def get(self, url, timeout=None):
+        return _FakeResponse(self.content)
+
+
+class ScrapeJobDetailsTest(unittest.TestCase):
+    def _scrape(self, content: bytes):
+        scraper = GreenhouseScraper(use_cached_urls=True)
+        scraper.session = _FakeSession(content)
+        return scraper._scrape_job_from_url("https://boards.greenhouse.io/acme/jobs/1")
+
+    def test_empty_page_gives_unknown_fields(self):
+        job = self._scrape(b"")
+        self.assertEqual((job.title, job.location), ("Unknown Title", "Unknown Location"))
+
+    def test_script_text_is_left_out_of_title_and_location(self):
+        job = self._scrape(
+            b'<html><body><h1>Engineer<script>track()</script></h1>'
+            b'<div class="location"> Remote <style>.x{}</style></div></body></html>'
+        )
+        self.assertEqual((job.title, job.location), ("Engineer", "Remote"))
+
+    def test_inline_markup_keeps_its_spacing(self):
+        job = self._scrape(
+            b'<html><body><h1>Senior <b>Data</b> Engineer</h1>'
+            b'<div class="location">San Francisco, <span>CA</span></div></body></html>'
+        )
+        self.assertEqual((job.title, job.location), ("Senior Data Engineer", "San Francisco, CA"))
+
+    def test_utf8_page_without_charset_is_decoded(self):
+        job = self._scrape(
+            '<html><body><h1>Ingénieur</h1><div class="location">São Paulo</div></body></html>'.encode()
+        )
+        self.assertEqual((job.title, job.location), ("Ingénieur", "São Paulo"))
+
+
+class ScrapeCompanyJobsApiTest(unittest.TestCase):
+    def _scrape(self, content: bytes):
+        scraper = GreenhouseScraper(use_cached_urls=True)
+        scraper.session = _FakeSession(content)
+        return scraper._scrape_company_jobs_api("acme")
+
+    def test_unexpected_payloads_give_no_jobs(self):
+        for content in (b'[]', b'null', b'{"jobs": null}', b'{"jobs": {}}', b'not json'):
+            with self.subTest(content=content):
+                self.assertEqual(self._scrape(content), [])
+
+    def test_jobs_are_parsed(self):
+        jobs = self._scrape(b'{"jobs": [{"title": "Engineer", "content": "<p>Python</p>"}]}')
+        self.assertEqual([(job.title, job.technical_skills) for job in jobs], [("Engineer", "Python")])
+
+
+class ParseCacheTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.scraper = GreenhouseScraper(use_cached_urls=True)
+        self.scraper.parse_cache_file = os.path.join(tmp.name, "job_parse_cache.json")
+
+    def _stored(self) -> dict:
+        with open(self.scraper.parse_cache_file, 'rb') as f:
+            return orjson.loads(f.read())
+
+    def test_results_are_reused_across_scrapers(self):
+        job = self.scraper._extract_job_from_html(_page(JOB_LD), "acme_jobs_1.html")
+        self.scraper._save_parse_cache()
+
+        other = GreenhouseScraper(use_cached_urls=True)
+        other.parse_cache_file = self.scraper.parse_cache_file
+        key = other._parse_cache_key(_page(JOB_LD), "acme_jobs_1.html", None)
+        self.assertEqual(other._cached_job(key), (True, job))
+
+    def test_file_from_another_parser_version_is_discarded(self):
+        with open(self.scraper.parse_cache_file, 'wb') as f:
+            f.write(orjson.dumps({'version': 0, 'entries': {'k': None}}))
+
+        self.assertEqual(self.scraper._parse_cache_entries(), {})
+        self.assertFalse(os.path.exists(self.scraper.parse_cache_file))
+
+    def test_least_recently_used_entries_are_dropped(self):
+        self.scraper.parse_cache_max_entries = 2
+        for key in ('a', 'b', 'c'):
+            self.scraper._remember_job(key, None)
+        self.scraper._cached_job('a')
+        self.scraper._save_parse_cache()
+
+        self.assertEqual(list(self._stored()['entries']), ['c', 'a'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import threading
+import time
+import unittest
+
+from src.job_curator.scraper.rate_limiter import HostRateLimiter, RateLimiter
+
+
+class RateLimiterTest(unittest.TestCase):
+    def test_calls_within_budget_do_not_wait(self):
+        limiter = RateLimiter(max_calls=3, period=1.0)
+        start = time.monotonic()
+        for _ in range(3):
+            limiter.wait()
+        self.assertLess(time.monotonic() - start, 0.05)
+
+    def test_call_over_budget_waits_for_the_window(self):
+        limiter = RateLimiter(max_calls=2, period=0.2)
+        start = time.monotonic()
+        for _ in range(3):
+            limiter.wait()
+        self.assertGreaterEqual(time.monotonic() - start, 0.19)
+
+    def test_concurrent_callers_share_the_budget(self):
+        limiter = RateLimiter(max_calls=1, period=0.1)
+        threads = [threading.Thread(target=limiter.wait) for _ in range(4)]
+        start = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertGreaterEqual(time.monotonic() - start, 0.29)
+
+
+class HostRateLimiterTest(unittest.TestCase):
+    def test_same_host_shares_a_budget(self):
+        limiter = HostRateLimiter(max_calls=1, period=0.2)
+        start = time.monotonic()
+        limiter.wait("https://boards.greenhouse.io/acme/jobs/1")
+        limiter.wait("https://boards.greenhouse.io/other/jobs/2")
+        self.assertGreaterEqual(time.monotonic() - start, 0.19)
+
+    def test_different_hosts_do_not_wait_on_each_other(self):
+        limiter = HostRateLimiter(max_calls=1, period=1.0)
+        start = time.monotonic()
+        limiter.wait("https://boards.greenhouse.io/acme/jobs/1")
+        limiter.wait("https://boards-api.greenhouse.io/v1/boards/acme/jobs")
+        self.assertLess(time.monotonic() - start, 0.05)
+
+
+if __name__ == '__main__':
+    unittest.main()